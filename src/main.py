@@ -1,14 +1,19 @@
+import gc
+import io
 import os
 import sys
 import csv
 import json
+import bisect
 import pygame
+import functools
 import arabic_reshaper
 from pathlib import Path
+from types import SimpleNamespace
 from hijri_converter import convert
 from bidi.algorithm import get_display
 from datetime import datetime, date, timedelta
-from typing import Dict, Any, Tuple, Optional
+from typing import Dict, Any, List, Set, Tuple, Optional, OrderedDict
 
 # --- Configuration & Utility Functions ---
 
@@ -21,36 +26,65 @@ WHITE = rgb(255, 255, 255)
 BLACK = rgb(0, 0, 0)
 GRAY = rgb(128, 128, 128)
 
-# Predefined color themes
-COLOR_THEMES = [
-    {"PRIMARY": rgb(0, 34, 68), "SECONDARY": rgb(68, 162, 255)},
-    {"PRIMARY": rgb(30, 30, 60), "SECONDARY": rgb(120, 120, 180)},
-    {"PRIMARY": rgb(50, 20, 20), "SECONDARY": rgb(200, 100, 100)},
-    {"PRIMARY": rgb(20, 40, 60), "SECONDARY": rgb(100, 150, 200)},
-    {"PRIMARY": rgb(40, 20, 60), "SECONDARY": rgb(160, 100, 200)},
-    {"PRIMARY": rgb(20, 60, 40), "SECONDARY": rgb(100, 200, 150)},
-    {"PRIMARY": rgb(60, 40, 20), "SECONDARY": rgb(200, 150, 100)},
-    {"PRIMARY": rgb(20, 20, 50), "SECONDARY": rgb(100, 100, 200)},
-    {"PRIMARY": rgb(30, 50, 30), "SECONDARY": rgb(120, 180, 120)},
-    {"PRIMARY": rgb(50, 30, 50), "SECONDARY": rgb(180, 120, 180)},
-    {"PRIMARY": rgb(20, 50, 50), "SECONDARY": rgb(100, 200, 200)},
-    {"PRIMARY": rgb(50, 50, 20), "SECONDARY": rgb(200, 200, 100)},
-    {"PRIMARY": rgb(20, 20, 80), "SECONDARY": rgb(100, 100, 240)},
-    {"PRIMARY": rgb(60, 30, 20), "SECONDARY": rgb(200, 150, 100)},
-    {"PRIMARY": rgb(10, 20, 30), "SECONDARY": rgb(80, 120, 160)},
-    {"PRIMARY": rgb(70, 30, 30), "SECONDARY": rgb(220, 110, 110)},
-    {"PRIMARY": rgb(30, 60, 90), "SECONDARY": rgb(140, 180, 220)},
-    {"PRIMARY": rgb(50, 10, 70), "SECONDARY": rgb(180, 90, 200)},
-    {"PRIMARY": rgb(10, 70, 50), "SECONDARY": rgb(90, 210, 170)},
-    {"PRIMARY": rgb(80, 50, 20), "SECONDARY": rgb(220, 170, 110)},
-    {"PRIMARY": rgb(30, 30, 70), "SECONDARY": rgb(120, 120, 220)},
-    {"PRIMARY": rgb(40, 70, 40), "SECONDARY": rgb(140, 210, 140)},
-    {"PRIMARY": rgb(70, 40, 70), "SECONDARY": rgb(210, 140, 210)},
-    {"PRIMARY": rgb(30, 70, 70), "SECONDARY": rgb(120, 220, 220)},
-    {"PRIMARY": rgb(70, 70, 30), "SECONDARY": rgb(220, 220, 120)},
-    {"PRIMARY": rgb(10, 10, 90), "SECONDARY": rgb(80, 80, 240)},
-    {"PRIMARY": rgb(90, 40, 20), "SECONDARY": rgb(240, 170, 110)},
-]
+# Predefined color themes, stored as parallel tables (theme i = PRIMARY_THEMES[i], SECONDARY_THEMES[i])
+PRIMARY_THEMES = (
+    rgb(0, 34, 68),
+    rgb(30, 30, 60),
+    rgb(50, 20, 20),
+    rgb(20, 40, 60),
+    rgb(40, 20, 60),
+    rgb(20, 60, 40),
+    rgb(60, 40, 20),
+    rgb(20, 20, 50),
+    rgb(30, 50, 30),
+    rgb(50, 30, 50),
+    rgb(20, 50, 50),
+    rgb(50, 50, 20),
+    rgb(20, 20, 80),
+    rgb(60, 30, 20),
+    rgb(10, 20, 30),
+    rgb(70, 30, 30),
+    rgb(30, 60, 90),
+    rgb(50, 10, 70),
+    rgb(10, 70, 50),
+    rgb(80, 50, 20),
+    rgb(30, 30, 70),
+    rgb(40, 70, 40),
+    rgb(70, 40, 70),
+    rgb(30, 70, 70),
+    rgb(70, 70, 30),
+    rgb(10, 10, 90),
+    rgb(90, 40, 20),
+)
+SECONDARY_THEMES = (
+    rgb(68, 162, 255),
+    rgb(120, 120, 180),
+    rgb(200, 100, 100),
+    rgb(100, 150, 200),
+    rgb(160, 100, 200),
+    rgb(100, 200, 150),
+    rgb(200, 150, 100),
+    rgb(100, 100, 200),
+    rgb(120, 180, 120),
+    rgb(180, 120, 180),
+    rgb(100, 200, 200),
+    rgb(200, 200, 100),
+    rgb(100, 100, 240),
+    rgb(200, 150, 100),
+    rgb(80, 120, 160),
+    rgb(220, 110, 110),
+    rgb(140, 180, 220),
+    rgb(180, 90, 200),
+    rgb(90, 210, 170),
+    rgb(220, 170, 110),
+    rgb(120, 120, 220),
+    rgb(140, 210, 140),
+    rgb(210, 140, 210),
+    rgb(120, 220, 220),
+    rgb(220, 220, 120),
+    rgb(80, 80, 240),
+    rgb(240, 170, 110),
+)
 
 # Hijri month names mapping
 HIJRI_MONTH_NAMES = {
@@ -59,12 +93,24 @@ HIJRI_MONTH_NAMES = {
     9: "Ramadan", 10: "Shawwal", 11: "Dhul-Qadah", 12: "Dhul-Hijjah"
 }
 
+# Gregorian month names (English, as shown on the display)
+MONTH_NAMES = (
+    "January", "February", "March", "April", "May", "June",
+    "July", "August", "September", "October", "November", "December"
+)
+
 # Arabic prayer names
 ARABIC_PRAYER_NAMES = {
     "Fajr": "فجر", "Dhuhr": "ظهر", "Asr": "عصر", "Maghrib": "مغرب",
     "Isha": "عشاء", "Jummah": "جمعة", "Sunrise": "شروق"
 }
 
+# Arabic prayer names reshaped and reordered for display (computed once)
+ARABIC_PRAYER_DISPLAY = {
+    name: get_display(arabic_reshaper.reshape(arabic))
+    for name, arabic in ARABIC_PRAYER_NAMES.items()
+}
+
 # File paths (portable)
 BASE_DIR = Path(__file__).resolve().parent  # src directory
 ASSET_PATH = str(BASE_DIR / "assets") + os.sep
@@ -72,38 +118,98 @@ FONT_PATH = ASSET_PATH + "fonts" + os.sep
 PRAYER_TIMES_FILE = ASSET_PATH + "prayer_times.csv"
 SETTINGS_FILE = ASSET_PATH + "settings.json"
 ADHAN_SOUND_FILE = ASSET_PATH + "adhan.wav"
+REGULAR_FONT_FILE = FONT_PATH + "regular.ttf"
+MEDIUM_FONT_FILE = FONT_PATH + "medium.ttf"
+BOLD_FONT_FILE = FONT_PATH + "bold.ttf"
+ARABIC_FONT_FILE = FONT_PATH + "arabic.ttf"
+
+# Characters of formatted clock and prayer times, pre-rendered into glyph atlases
+TIME_GLYPHS = "0123456789:APM "
 
+# Maximum number of rendered text surfaces kept in memory
+TEXT_CACHE_SIZE = 256
+COUNTDOWN_CACHE_SIZE = 120 # A minute of seconds plus the unit variants
+
+# Events the main loop handles; everything else is blocked from the queue
+HANDLED_EVENTS = [pygame.QUIT, pygame.KEYDOWN, pygame.WINDOWEXPOSED, pygame.VIDEOEXPOSE]
+
+# Main loop wake-up: just past each second boundary, when the clock display changes
+TICK_MARGIN_MS = 1
+
+@functools.lru_cache(maxsize=2048) # Schedules repeat the same few times across rows and columns
 def format_prayer_time(time_str: str) -> str:
     """Convert time string from 'HH:MM' to 'HH:MM AM/PM' format."""
     if not time_str:
         return ""
-    try:
-        time_obj = datetime.strptime(time_str, '%H:%M')
-        return time_obj.strftime('%I:%M %p')
-    except ValueError:
+    # Parsed by hand: this runs for every CSV cell and strptime is slow for a fixed format
+    hour_str, _, minute_str = time_str.partition(':')
+    # Same inputs as strptime('%H:%M'): one or two ASCII digits on each side, nothing else
+    for part in (hour_str, minute_str):
+        if not (part.isascii() and part.isdigit() and len(part) <= 2):
+            return ""
+    hour, minute = int(hour_str), int(minute_str)
+    if not (0 <= hour < 24 and 0 <= minute < 60):
         return ""
+    suffix = "AM" if hour < 12 else "PM"
+    return f"{hour % 12 or 12:02d}:{minute:02d} {suffix}"
+
+def snap_to_pixel(value: float) -> int:
+    """Rounds a coordinate to a whole pixel the way pygame.Rect does (halves away from zero)."""
+    return int(value + 0.5) if value >= 0 else int(value - 0.5)
+
+def format_clock_time(value: datetime) -> str:
+    """Format a time as 'HH:MM:SS AM/PM' (same as strftime('%I:%M:%S %p'), without the format parsing)."""
+    hour = value.hour
+    suffix = "AM" if hour < 12 else "PM"
+    return f"{hour % 12 or 12:02d}:{value.minute:02d}:{value.second:02d} {suffix}"
+
+def format_gregorian_date(value: date) -> str:
+    """Format a date as 'DD Month YYYY' (same as strftime('%d %B %Y') in English)."""
+    return f"{value.day:02d} {MONTH_NAMES[value.month - 1]} {value.year}"
 
 def load_prayer_times(filename: str) -> Dict[str, Dict[str, str]]:
     """Load prayer times from a CSV file."""
     prayer_times = {}
     try:
         with open(filename, newline='') as csvfile:
-            reader = csv.DictReader(csvfile)
+            # Plain reader with fixed column indices avoids building a dict per row
+            reader = csv.reader(csvfile)
+            header = next(reader, [])
+            if "Date" not in header:
+                return prayer_times
+
+            date_idx = header.index("Date")
+            other_cols = [(i, name) for i, name in enumerate(header) if i != date_idx]
+            n_cols = len(header)
+            format_time = format_prayer_time
+
             for row in reader:
-                # Use a dictionary comprehension to apply the formatting
-                prayer_times[row["Date"]] = {
-                    key: format_prayer_time(row[key])
-                    for key in row if key != "Date"
-                }
+                if not row:
+                    continue # Skip blank lines
+                if len(row) < n_cols:
+                    row += [""] * (n_cols - len(row)) # Treat missing cells as empty
+                prayer_times[row[date_idx]] = {name: format_time(row[i]) for i, name in other_cols}
     except FileNotFoundError:
         print(f"Error: Prayer times file not found at {filename}")
     return prayer_times
 
-def get_today_prayer_times(prayer_times: Dict[str, Dict[str, str]]) -> Optional[Dict[str, str]]:
-    """Get today's prayer times."""
-    today = date.today().strftime("%Y-%m-%d")
+def get_today_prayer_times(prayer_times: Dict[str, Dict[str, str]], today: Optional[date] = None) -> Optional[Dict[str, str]]:
+    """Get today's prayer times (or those of the given date)."""
+    today = (today or date.today()).strftime("%Y-%m-%d")
     return prayer_times.get(today, None)
 
+# Raw TTF data by file path, so each font file is read from disk only once
+_font_data: Dict[str, bytes] = {}
+
+def load_font(filename: str, size: int) -> pygame.font.Font:
+    """Create a Pygame Font from a TTF file, reusing the file contents already read."""
+    data = _font_data.get(filename)
+    if data is None:
+        with open(filename, "rb") as font_file:
+            data = font_file.read()
+        _font_data[filename] = data
+    return pygame.font.Font(io.BytesIO(data), size)
+
 def load_settings(default_settings: Dict[str, Any]) -> Dict[str, Any]:
     """Load settings from JSON file, using defaults if file is missing or corrupt."""
     try:
@@ -120,6 +226,45 @@ def save_settings(settings: Dict[str, Any]):
     except IOError:
         print("Error: Could not save settings file.")
 
+# --- Glyph Atlas ---
+
+class GlyphAtlas:
+    """Glyphs of one font and color rendered once and packed side by side into a single surface."""
+
+    def __init__(self, font: pygame.font.Font, chars: str, color: Tuple[int, int, int]):
+        glyphs = [font.render(char, True, color) for char in chars]
+        self.height = font.get_height()
+        self.surface = pygame.Surface((sum(glyph.get_width() for glyph in glyphs), self.height), pygame.SRCALPHA)
+        self.glyphs: Dict[str, pygame.Rect] = {} # char -> area within the atlas surface
+
+        x = 0
+        for char, glyph in zip(chars, glyphs):
+            self.surface.blit(glyph, (x, 0))
+            self.glyphs[char] = pygame.Rect(x, 0, glyph.get_width(), glyph.get_height())
+            x += glyph.get_width()
+        self.surface = self.surface.convert_alpha() # Match the display's pixel format once
+
+    def supports(self, text: str) -> bool:
+        """Returns True if every character of text is in the atlas."""
+        return all(char in self.glyphs for char in text)
+
+    def layout(self, text: str, topleft: Tuple[int, int]) -> Tuple[List[tuple], int]:
+        """Returns the (surface, dest, area) blits that draw text at topleft, and its total width."""
+        x, y = topleft
+        blits = []
+        for char in text:
+            area = self.glyphs[char]
+            blits.append((self.surface, (x, y), area))
+            x += area.width
+        return blits, x - topleft[0]
+
+    def render(self, text: str) -> pygame.Surface:
+        """Composes text from the atlas into a new transparent surface, like Font.render."""
+        blits, width = self.layout(text, (0, 0))
+        surface = pygame.Surface((width, self.height), pygame.SRCALPHA)
+        surface.blits(blits, doreturn=False)
+        return surface
+
 # --- Main Application Class ---
 
 class MasjidDisplay:
@@ -130,38 +275,98 @@ class MasjidDisplay:
         pygame.init()
         pygame.mouse.set_visible(False)
 
+        # Only quit, key and expose events are handled; keep everything else off the event queue
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed(HANDLED_EVENTS)
+
         # 1. Display Setup
-        # self.window = pygame.display.set_mode((0, 0), pygame.FULLSCREEN)
-        self.window = pygame.display.set_mode((1600, 960)) # For testing in windowed mode
+        # Settings are read once here; defaults depend on the screen size, so they are filled in below.
+        # Vsync is opt-in ("vsync": true in settings.json) since it can cost more CPU on some drivers
+        stored_settings = load_settings({})
+        self.vsync = bool(stored_settings.get("vsync", False))
+        # self.window = self._create_window((0, 0), pygame.FULLSCREEN)
+        self.window = self._create_window((1600, 960)) # For testing in windowed mode
 
         pygame.display.set_caption('Masjid Nurul Islam')
         self.screen_width, self.screen_height = self.window.get_size()
+        self._compute_layout()
 
         # 2. Settings and Theme Management
         self.default_settings = self._get_default_settings()
-        self.settings = load_settings(self.default_settings)
+        self.settings = stored_settings or self.default_settings.copy()
         self.current_theme_index = self.settings.get("current_theme_index", 0)
         self.PRIMARY, self.SECONDARY = self._get_current_theme()
 
         # 3. Font Setup
         self.fonts = {}
+        # (font id, text, color, center) -> (surface, rect)
+        self._text_cache: OrderedDict[Tuple[int, str, Tuple[int, int, int], Optional[Tuple[int, int]]], Tuple[pygame.Surface, pygame.Rect]] = OrderedDict()
+        # (value, unit, colors) -> (value surface, value rect, unit surface, unit rect)
+        self._countdown_cache: Dict[Tuple[str, str, Tuple[int, int, int], Tuple[int, int, int]], tuple] = {}
+        # (prayer, adhan, iqamah, color) -> (row surface, row position)
+        self._row_cache: Dict[Tuple[str, str, str, Tuple[int, int, int]], Tuple[pygame.Surface, Tuple[int, int]]] = {}
         self._setup_fonts()
 
+        # Static background and label layers, rebuilt when the theme changes
+        self._background_surface: Optional[pygame.Surface] = None
+        self._sunrise_labels: Optional[Tuple[pygame.Surface, Tuple[int, int]]] = None # (surface, offset)
+        self._build_background()
+        self._build_static_layers()
+
         # 4. Data and State
         self.current_date = date.today()
         self.prayer_times = load_prayer_times(PRAYER_TIMES_FILE)
         self.today_prayers = get_today_prayer_times(self.prayer_times)
+
+        # Per-day state, refreshed when the calendar day changes
+        self._day_state_date: Optional[date] = None
+        self._today_weekday: Optional[int] = None
+        self._is_friday = False
+        self._today_prayer_order: Tuple[str, ...] = ()
+
+        # Today's Adhan/Iqamah times parsed once per day, sorted: (time, prayer, is_iqamah)
+        self._parsed_today: List[Tuple[datetime, str, bool]] = []
+        self._parsed_times: List[datetime] = [] # Just the times, for bisecting
+        self._tomorrow_fajr: Optional[datetime] = None
+        self._maghrib_time: Optional[datetime] = None
+
+        # Adhan/Iqamah sounds still to play today, by event key (e.g. "Fajr", "Fajr_Iqamah")
+        self._next_fire: Dict[str, datetime] = {}
+        # (event key, time) pairs already fired (or skipped) on _fired_date, so a same-day rebuild cannot
+        # re-add them; an event whose time was corrected in the CSV is a new pair and still fires
+        self._fired_keys: Set[Tuple[str, datetime]] = set()
+        self._fired_date: Optional[date] = None
+
+        # Hijri dates by (offset-adjusted) Gregorian date; they change at most twice a day
+        self._hijri_cache: Dict[date, Tuple[int, str, int, str]] = {}
         
         self.islamic_date_offset = -1  # Manual adjustment
         self.hide_eid_message = True
+
+        self._running = True # Cleared to leave the main loop
+
+        # Redraw tracking: static areas are only redrawn when the displayed state changes
+        self._last_frame_state: Optional[tuple] = None
+        self._last_time_str: Optional[str] = None
+        self._last_countdown_key: Optional[tuple] = None
+        self._dirty: List[pygame.Rect] = []
+        self._frame_blits: List[tuple] = [] # (surface, dest[, area]) drawn in one batch per frame
         
         # 5. Audio Setup
         self.adhan_sound = pygame.mixer.Sound(ADHAN_SOUND_FILE)
         self.adhan_sound.set_volume(1.0)
-        self.beep_played: Dict[str, bool] = {
-            "Fajr": False, "Dhuhr": False, "Asr": False,
-            "Maghrib": False, "Isha": False, "Jummah": False
-        }
+
+    def _create_window(self, size: Tuple[int, int], flags: int = 0) -> pygame.Surface:
+        """Creates the display window, with vsync if enabled and supported by the driver."""
+        if self.vsync:
+            if size == (0, 0):
+                size = pygame.display.get_desktop_sizes()[0] # SCALED modes need an explicit size
+            try:
+                return pygame.display.set_mode(size, flags | pygame.SCALED, vsync=1)
+            except pygame.error:
+                print("Warning: Vsync is not available, continuing without it.")
+                self.vsync = False
+        return pygame.display.set_mode(size, flags)
 
     def _get_default_settings(self) -> Dict[str, Any]:
         """Returns the default settings dictionary based on screen size."""
@@ -170,16 +375,83 @@ class MasjidDisplay:
             "date_font_size": int(self.screen_height * 0.047),
             "islamic_date_font_size": int(self.screen_height * 0.042),
             "eid_announcement_font_size": int(self.screen_height * 0.042),
+            "vsync": False,
         }
 
+    def _compute_layout(self):
+        """Precomputes the pixel positions used by the drawing methods from the screen size."""
+        sw, sh = self.screen_width, self.screen_height
+
+        panel_width = int(sw * 0.365) # Right-hand side (Info Panel)
+        masthead_height = int(sh * 0.14)
+        panel_x = sw - panel_width
+
+        # Prayer table columns
+        center_x = sw // 2 + int(sw * 0.108)
+        adhan_center_x = center_x - int(sw * 0.03)
+        name_x = int(sw * 0.02)
+        adhan_x = adhan_center_x - int(sw * 0.21)
+        iqamah_x = center_x - int(sw * 0.065)
+
+        self.layout = SimpleNamespace(
+            # Background panels
+            info_rect=pygame.Rect(panel_x, 0, panel_width, masthead_height),
+            clock_panel_rect=pygame.Rect(0, 0, panel_x, masthead_height),
+            countdown_panel_rect=pygame.Rect(panel_x, masthead_height, panel_width, sh - masthead_height),
+            border_x=panel_x - int(sw * 0.005), # Logical border position for date/time elements
+
+            # Masjid name and address
+            title_center=(int(sw * 0.82), int(sh * 0.05)),
+            subtitle_center=(int(sw * 0.82), int(sh * 0.10)),
+
+            # Current time and dates
+            clock_topleft=(int(sw * 0.02), int(sh * 0.01)),
+            date_x=center_x - int(sw * 0.204),
+            date_dy=int(sh * 0.02),
+            islamic_date_dy=int(sh * 0.025),
+            date_margin=int(sw * 0.01),
+
+            # Prayer table
+            name_x=name_x,
+            adhan_x=adhan_x,
+            iqamah_x=iqamah_x,
+            label_y=int(sh * 0.25) - int(sh * 0.05),
+            rows_top=int(sh * 0.25),
+            time_dy=int(sh * 0.035),
+            arabic_gap=int(sw * 0.01),
+            arabic_dy=int(sh * 0.015),
+            row_step_wide=int(sh * 0.125),
+            row_step_compact=int(sh * 0.10), # Used while the Eid message is shown
+
+            # Eid announcement: average of the three columns, with the original manual adjustment
+            eid_center_x=(name_x + adhan_x + iqamah_x) // 3 - int(sw * 0.013),
+            eid_dy=int(sh * 0.05),
+            eid_line_dy=int(sh * 0.02),
+
+            # Countdown
+            countdown_x=int(sw * 0.82),
+            countdown_text_y=int(sh * 0.30),
+            countdown_value_y=int(sh * 0.50),
+            countdown_unit_dy=int(sh * 0.00050),
+
+            # Sunrise, offset from the countdown unit text
+            sunrise_text_dx=-int(sw * 0.05),
+            sunrise_dy=int(sh * 0.09),
+            sunrise_arabic_dx=int(sw * 0.057),
+            sunrise_arabic_dy=int(sh * 0.09) - int(sh * 0.003),
+            sunrise_time_dx=-int(sw * 0.005),
+            sunrise_time_dy=int(sh * 0.164),
+        )
+
     def _get_current_theme(self) -> Tuple[Tuple[int, int, int], Tuple[int, int, int]]:
         """Returns the primary and secondary colors for the current theme."""
-        theme = COLOR_THEMES[self.current_theme_index % len(COLOR_THEMES)]
-        return theme["PRIMARY"], theme["SECONDARY"]
+        i = self.current_theme_index % len(PRIMARY_THEMES)
+        return PRIMARY_THEMES[i], SECONDARY_THEMES[i]
 
     def _setup_fonts(self):
         """Initializes all Pygame Font objects with dynamic sizing."""
         sh = self.screen_height
+        self._clear_render_caches()
         
         sizes = {
             "current_time": int(sh * 0.11),
@@ -197,37 +469,51 @@ class MasjidDisplay:
         }
 
         # Regular font styles
-        self.fonts["current_time"] = pygame.font.Font(FONT_PATH + "regular.ttf", sizes["current_time"])
-        self.fonts["prayer_times_adhan"] = pygame.font.Font(FONT_PATH + "regular.ttf", sizes["prayer_times"])
-        self.fonts["prayer_times_jamat"] = pygame.font.Font(FONT_PATH + "regular.ttf", sizes["prayer_times"])
-        self.fonts["date"] = pygame.font.Font(FONT_PATH + "regular.ttf", sizes["date"])
-        self.fonts["islamic_date"] = pygame.font.Font(FONT_PATH + "regular.ttf", sizes["islamic_date"])
-        self.fonts["countdown_value"] = pygame.font.Font(FONT_PATH + "regular.ttf", sizes["countdown_value"])
+        self.fonts["current_time"] = load_font(REGULAR_FONT_FILE, sizes["current_time"])
+        self.fonts["prayer_times_adhan"] = load_font(REGULAR_FONT_FILE, sizes["prayer_times"])
+        self.fonts["prayer_times_jamat"] = load_font(REGULAR_FONT_FILE, sizes["prayer_times"])
+        self.fonts["date"] = load_font(REGULAR_FONT_FILE, sizes["date"])
+        self.fonts["islamic_date"] = load_font(REGULAR_FONT_FILE, sizes["islamic_date"])
+        self.fonts["countdown_value"] = load_font(REGULAR_FONT_FILE, sizes["countdown_value"])
 
         # Medium font styles
-        self.fonts["sub_text"] = pygame.font.Font(FONT_PATH + "medium.ttf", sizes["sub_text"])
-        self.fonts["prayer_times"] = pygame.font.Font(FONT_PATH + "medium.ttf", sizes["prayer_times"])
-        self.fonts["sunrise_text"] = pygame.font.Font(FONT_PATH + "medium.ttf", sizes["countdown_unit"])
+        self.fonts["sub_text"] = load_font(MEDIUM_FONT_FILE, sizes["sub_text"])
+        self.fonts["prayer_times"] = load_font(MEDIUM_FONT_FILE, sizes["prayer_times"])
+        self.fonts["sunrise_text"] = load_font(MEDIUM_FONT_FILE, sizes["countdown_unit"])
 
         # Bold font styles
-        self.fonts["text"] = pygame.font.Font(FONT_PATH + "bold.ttf", sizes["text"])
-        self.fonts["eid_announcement"] = pygame.font.Font(FONT_PATH + "bold.ttf", sizes["eid_announcement"])
-        self.fonts["countdown_text"] = pygame.font.Font(FONT_PATH + "bold.ttf", sizes["countdown_text"])
-        self.fonts["countdown_unit"] = pygame.font.Font(FONT_PATH + "bold.ttf", sizes["countdown_unit"])
+        self.fonts["text"] = load_font(BOLD_FONT_FILE, sizes["text"])
+        self.fonts["eid_announcement"] = load_font(BOLD_FONT_FILE, sizes["eid_announcement"])
+        self.fonts["countdown_text"] = load_font(BOLD_FONT_FILE, sizes["countdown_text"])
+        self.fonts["countdown_unit"] = load_font(BOLD_FONT_FILE, sizes["countdown_unit"])
 
         # Arabic font styles
-        self.fonts["prayer_times_arabic"] = pygame.font.Font(FONT_PATH + "arabic.ttf", sizes["arabic"])
-        self.fonts["sunrise_arabic"] = pygame.font.Font(FONT_PATH + "arabic.ttf", sizes["arabic"])
+        self.fonts["prayer_times_arabic"] = load_font(ARABIC_FONT_FILE, sizes["arabic"])
+        self.fonts["sunrise_arabic"] = load_font(ARABIC_FONT_FILE, sizes["arabic"])
+
+        # White time strings (clock, Adhan/Iqamah and Sunrise times) are composed from glyph atlases
+        self._glyph_atlases: Dict[str, GlyphAtlas] = {
+            font_key: GlyphAtlas(self.fonts[font_key], TIME_GLYPHS, WHITE)
+            for font_key in ("current_time", "prayer_times_adhan", "prayer_times_jamat")
+        }
 
-    def _handle_input(self):
-        """Handles keyboard and system events."""
-        for event in pygame.event.get():
+    def _handle_input(self, timeout_ms: int = 0):
+        """Handles keyboard and system events, sleeping up to timeout_ms until one arrives."""
+        events = pygame.event.get(HANDLED_EVENTS)
+        if not events and timeout_ms > 0:
+            event = pygame.event.wait(timeout_ms) # Key presses still wake the loop immediately
+            if event.type != pygame.NOEVENT:
+                events = [event] + pygame.event.get(HANDLED_EVENTS)
+
+        for event in events:
             if event.type == pygame.QUIT:
-                self.quit()
+                self._running = False
+            elif event.type in (pygame.WINDOWEXPOSED, pygame.VIDEOEXPOSE):
+                self._last_frame_state = None # Window contents were damaged; redraw all of it next frame
             elif event.type == pygame.KEYDOWN:
                 # --- Application Controls ---
                 if event.key == pygame.K_ESCAPE:
-                    self.quit() # Exit the application
+                    self._running = False # Exit the application
                 elif event.key == pygame.K_TAB:
                     self.reload_data() # Reload prayer times from CSV
                 
@@ -251,12 +537,15 @@ class MasjidDisplay:
 
     def _cycle_theme(self, key):
         """Cycles through color themes and updates display colors."""
-        n_themes = len(COLOR_THEMES)
+        n_themes = len(PRIMARY_THEMES)
         if key == pygame.K_RIGHT:
             self.current_theme_index = (self.current_theme_index + 1) % n_themes
         elif key == pygame.K_LEFT:
             self.current_theme_index = (self.current_theme_index - 1) % n_themes
         self.PRIMARY, self.SECONDARY = self._get_current_theme()
+        self._clear_render_caches()
+        self._build_background()
+        self._build_static_layers()
 
     def _adjust_font_size(self, font_key, key):
         """Adjusts font size, updates settings, and reloads the font."""
@@ -269,112 +558,136 @@ class MasjidDisplay:
             new_size = max(1, current_size - 1)
 
         self.settings[size_key] = new_size
-        self.fonts[font_key] = pygame.font.Font(FONT_PATH + "regular.ttf" if font_key in ["date", "islamic_date"] else FONT_PATH + "bold.ttf", new_size)
+        self._clear_render_caches()
+        self.fonts[font_key] = load_font(REGULAR_FONT_FILE if font_key in ["date", "islamic_date"] else BOLD_FONT_FILE, new_size)
 
     def _reset_settings(self):
         """Resets all adjustable settings to their default values and updates fonts."""
+        vsync = self.settings.get("vsync", False) # Only set by editing settings.json, so kept
         self.settings = self._get_default_settings()
+        self.settings["vsync"] = vsync
         self.current_theme_index = self.settings["current_theme_index"]
         self.PRIMARY, self.SECONDARY = self._get_current_theme()
         self._setup_fonts() # Re-initialize fonts with default sizes
+        self._build_background()
+        self._build_static_layers()
 
     def reload_data(self):
         """Reloads prayer times from the CSV file."""
         self.prayer_times = load_prayer_times(PRAYER_TIMES_FILE)
-        self.today_prayers = get_today_prayer_times(self.prayer_times)
+        self.today_prayers = get_today_prayer_times(self.prayer_times, self.current_date)
+        self._day_state_date = None # Force the day state to be rebuilt
         print("Prayer times reloaded.")
 
-    def _get_islamic_date(self, current_time: datetime) -> Tuple[int, str, int]:
-        """Calculates the Hijri date, adjusting at Maghrib and applying manual offset."""
-        today_gregorian = current_time.date()
-        date_to_convert = today_gregorian
+    def _get_islamic_date(self, current_time: datetime) -> Tuple[int, str, int, str]:
+        """Calculates the Hijri date (day, month name, year, display string), adjusting at Maghrib and applying manual offset."""
+        date_to_convert = current_time.date()
 
-        # 1. Maghrib check for date rollover
-        maghrib_time_str = self.today_prayers.get("Maghrib", "") if self.today_prayers else ""
-        if maghrib_time_str:
-            try:
-                maghrib_time = datetime.strptime(maghrib_time_str, '%I:%M %p').replace(
-                    year=current_time.year, month=current_time.month, day=current_time.day
-                )
-                if current_time >= maghrib_time:
-                    date_to_convert += timedelta(days=1)
-            except ValueError:
-                pass # Use current day if Maghrib time is invalid
+        # 1. Maghrib check for date rollover (current day if Maghrib time is missing or invalid)
+        if self._maghrib_time and current_time >= self._maghrib_time:
+            date_to_convert += timedelta(days=1)
 
         # 2. Apply manual offset
         date_to_convert += timedelta(days=self.islamic_date_offset)
 
-        # 3. Conversion
-        hijri_date = convert.Gregorian(
-            date_to_convert.year, date_to_convert.month, date_to_convert.day
-        ).to_hijri()
-
-        return hijri_date.day, HIJRI_MONTH_NAMES[hijri_date.month], hijri_date.year
+        # 3. Conversion (memoized)
+        cached = self._hijri_cache.get(date_to_convert)
+        if cached is None:
+            hijri_date = convert.Gregorian(
+                date_to_convert.year, date_to_convert.month, date_to_convert.day
+            ).to_hijri()
+            h_day, h_month, h_year = hijri_date.day, HIJRI_MONTH_NAMES[hijri_date.month], hijri_date.year
+            cached = (h_day, h_month, h_year, f"{h_day:02d} {h_month} {h_year}")
+            self._hijri_cache[date_to_convert] = cached
+
+        return cached
+
+    def _refresh_day_state(self, now: datetime):
+        """Rebuilds the weekday, prayer order and parsed Adhan/Iqamah times when the day changes."""
+        today = now.date()
+        if self._day_state_date == today:
+            return
 
-    def _get_time_until_next_event(self) -> Tuple[Optional[str], int, int, int, bool]:
-        """Calculates time remaining until the next Adhan or Iqamah."""
+        self._day_state_date = today
+        if self._fired_date != today:
+            self._fired_date = today
+            self._fired_keys.clear()
+        self._today_weekday = today.weekday()
+        self._is_friday = self._today_weekday == 4
+        # Jummah replaces Dhuhr on Fridays
+        self._today_prayer_order = ("Fajr", "Jummah" if self._is_friday else "Dhuhr", "Asr", "Maghrib", "Isha")
+
+        self._parsed_today = []
+        self._parsed_times = []
+        self._tomorrow_fajr = None
+        self._maghrib_time = None
+        self._next_fire = {}
+        self._row_cache.clear() # Rows for previous days' times are no longer needed
         if not self.today_prayers:
-            return None, 0, 0, 0, False
-
-        current_time = datetime.now()
-        is_friday = current_time.weekday() == 4
-        next_event = None
-        min_time_diff = None
-        is_iqamah = False
-
-        # Define the order of checks
-        prayer_order = ["Fajr", "Dhuhr", "Asr", "Maghrib", "Isha"]
-        if is_friday:
-            prayer_order[1] = "Jummah" # Use Jummah instead of Dhuhr
-
-        # Check for events today
-        for prayer in prayer_order:
-            if not is_friday and prayer == "Jummah":
-                continue # Skip Jummah on non-Fridays
+            return
 
+        for prayer in self._today_prayer_order:
             adhan_time_str = self.today_prayers.get(prayer, "")
             iqamah_time_str = self.today_prayers.get(f"{prayer}_Iqamah", "")
 
-            # Combine Adhan and Iqamah times for comparison
-            times_to_check = []
+            # Combine Adhan and Iqamah times (Iqamah only if it differs, to avoid double events)
+            times_to_parse = []
             if adhan_time_str:
-                times_to_check.append((adhan_time_str, False))
+                times_to_parse.append((adhan_time_str, False))
             if iqamah_time_str and adhan_time_str != iqamah_time_str:
-                times_to_check.append((iqamah_time_str, True))
+                times_to_parse.append((iqamah_time_str, True))
 
-            for time_str, is_iqamah_event in times_to_check:
+            for time_str, is_iqamah in times_to_parse:
                 try:
-                    event_time = datetime.strptime(time_str, '%I:%M %p').replace(
-                        year=current_time.year, month=current_time.month, day=current_time.day
-                    )
-                    if event_time > current_time:
-                        time_diff = event_time - current_time
-                        if min_time_diff is None or time_diff < min_time_diff:
-                            min_time_diff = time_diff
-                            next_event = prayer
-                            is_iqamah = is_iqamah_event
+                    event_time = datetime.combine(today, datetime.strptime(time_str, '%I:%M %p').time())
                 except ValueError:
                     continue # Skip if time string is invalid
+                self._parsed_today.append((event_time, prayer, is_iqamah))
+                if prayer == "Maghrib" and not is_iqamah:
+                    self._maghrib_time = event_time # Hijri date rolls over at Maghrib
+
+        # Stable sort keeps the prayer order for events at the same time
+        self._parsed_today.sort(key=lambda event: event[0])
+        self._parsed_times = [event[0] for event in self._parsed_today]
+
+        # Schedule today's remaining sounds
+        for event_time, prayer, is_iqamah in self._parsed_today:
+            key = f"{prayer}_Iqamah" if is_iqamah else prayer
+            if (key, event_time) in self._fired_keys:
+                continue # Already played today, before a reload rebuilt the schedule
+            if now < event_time + timedelta(seconds=1): # Still within the event's first second
+                self._next_fire[key] = event_time
+
+        # Next day's Fajr, used once all of today's events have passed
+        next_day = today + timedelta(days=1)
+        next_day_prayers = self.prayer_times.get(next_day.strftime("%Y-%m-%d"), None)
+        fajr_time_str = next_day_prayers.get("Fajr", "") if next_day_prayers else ""
+        if fajr_time_str:
+            try:
+                self._tomorrow_fajr = datetime.combine(next_day, datetime.strptime(fajr_time_str, '%I:%M %p').time())
+            except ValueError:
+                pass
+
+    def _get_time_until_next_event(self, current_time: datetime) -> Tuple[Optional[str], int, int, int, bool]:
+        """Calculates time remaining until the next Adhan or Iqamah."""
+        if not self.today_prayers:
+            return None, 0, 0, 0, False
+
+        next_event = None
+        min_time_diff = None
+        is_iqamah = False
+
+        # Events are sorted by time, so the next event is the first one after now
+        index = bisect.bisect_right(self._parsed_times, current_time)
+        if index < len(self._parsed_today):
+            event_time, next_event, is_iqamah = self._parsed_today[index]
+            min_time_diff = event_time - current_time
 
-        # If no more events today, check for next day's Fajr
-        if next_event is None:
-            next_day = current_time + timedelta(days=1)
-            next_day_str = next_day.strftime("%Y-%m-%d")
-            next_day_prayers = self.prayer_times.get(next_day_str, None)
-
-            if next_day_prayers:
-                fajr_time_str = next_day_prayers.get("Fajr", "")
-                if fajr_time_str:
-                    try:
-                        fajr_time = datetime.strptime(fajr_time_str, '%I:%M %p').replace(
-                            year=next_day.year, month=next_day.month, day=next_day.day
-                        )
-                        time_diff = fajr_time - current_time
-                        min_time_diff = time_diff
-                        next_event = "Fajr"
-                        is_iqamah = False
-                    except ValueError:
-                        pass
+        # If no more events today, count down to next day's Fajr
+        if next_event is None and self._tomorrow_fajr:
+            min_time_diff = self._tomorrow_fajr - current_time
+            next_event = "Fajr"
+            is_iqamah = False
 
         # Format the result
         if min_time_diff:
@@ -391,348 +704,431 @@ class MasjidDisplay:
         if not self.today_prayers:
             return
 
-        for prayer in ["Fajr", "Dhuhr", "Asr", "Maghrib", "Isha", "Jummah"]:
-            # Skip Dhuhr on Friday and Jummah on non-Friday
-            is_friday = current_time.weekday() == 4
-            if (prayer == "Dhuhr" and is_friday) or (prayer == "Jummah" and not is_friday):
-                continue
-
-            adhan_time_str = self.today_prayers.get(prayer, "")
-            iqamah_time_str = self.today_prayers.get(f"{prayer}_Iqamah", "")
-
-            # Helper to check and play for a specific time
-            def check_time(time_str: str, key: str):
-                if not time_str:
-                    return
-
-                try:
-                    event_time = datetime.strptime(time_str, '%I:%M %p').replace(
-                        year=current_time.year, month=current_time.month, day=current_time.day
-                    )
-                except ValueError:
-                    return
-
-                # Check if the current time just passed the event time (within 1 second)
-                if event_time <= current_time < event_time + timedelta(seconds=1):
-                    if not self.beep_played.get(key, False):
-                        self.adhan_sound.play()
-                        self.beep_played[key] = True
-                elif current_time > event_time + timedelta(seconds=1):
-                    # Reset the flag after the event has passed
-                    self.beep_played[key] = False
-
-            # Check Adhan
-            check_time(adhan_time_str, prayer)
-            # Check Iqamah (only if it's different from Adhan to avoid double beep)
-            if iqamah_time_str and iqamah_time_str != adhan_time_str:
-                check_time(iqamah_time_str, f"{prayer}_Iqamah")
-
+        # Each event fires once, then is dropped until the schedule is rebuilt for the next day
+        for key, fire_time in list(self._next_fire.items()):
+            if current_time >= fire_time:
+                # Stay silent for events missed by more than a second (e.g. after the clock jumped)
+                if current_time < fire_time + timedelta(seconds=1):
+                    self.adhan_sound.play()
+                del self._next_fire[key]
+                self._fired_keys.add((key, fire_time))
 
     # --- Drawing Methods ---
 
-    def _draw_background_and_masthead(self):
-        """Draws the main background and the header sections."""
-        sw, sh = self.screen_width, self.screen_height
+    def _clear_render_caches(self):
+        """Drops cached text surfaces after a font or theme change."""
+        self._text_cache.clear()
+        self._countdown_cache.clear()
+        self._row_cache.clear()
+
+    def _rasterize(self, font_key: str, text: str, color: Tuple[int, int, int]) -> pygame.Surface:
+        """Renders text with the given font, from its glyph atlas when one covers the text.
+
+        The result is converted to the display's pixel format, so later blits need no conversion.
+        """
+        atlas = self._glyph_atlases.get(font_key)
+        if atlas is not None and color == WHITE and atlas.supports(text):
+            return atlas.render(text).convert_alpha()
+        return self.fonts[font_key].render(text, True, color).convert_alpha()
+
+    def _render_at(
+        self, font_key: str, text: str, color: Tuple[int, int, int], center: Optional[Tuple[float, float]]
+    ) -> Tuple[pygame.Surface, pygame.Rect]:
+        """Renders text centered on center, reusing the cached surface and rect when possible.
+
+        Center is snapped like Rect.center; the returned rect is shared with the cache and must not be modified.
+        """
+        if center:
+            center = (snap_to_pixel(center[0]), snap_to_pixel(center[1]))
+        font = self.fonts[font_key]
+        key = (id(font), text, color, center)
+        cached = self._text_cache.get(key)
+        if cached is None:
+            surface = self._rasterize(font_key, text, color)
+            cached = (surface, surface.get_rect(center=center) if center else surface.get_rect())
+            self._text_cache[key] = cached
+            if len(self._text_cache) > TEXT_CACHE_SIZE:
+                self._text_cache.popitem(last=False) # Drop the least recently used surface
+        else:
+            self._text_cache.move_to_end(key)
+        return cached
+
+    def _render(self, font_key: str, text: str, color: Tuple[int, int, int]) -> pygame.Surface:
+        """Renders text with the given font, reusing the cached surface when possible."""
+        return self._render_at(font_key, text, color, None)[0]
+
+    def _build_background(self):
+        """Pre-renders the main background and the masthead into a single surface."""
+        layout = self.layout
+        background = pygame.Surface((self.screen_width, self.screen_height))
 
         # Main background
-        self.window.fill(self.PRIMARY)
+        background.fill(self.PRIMARY)
 
-        # Right-hand side (Info Panel)
-        rect_width = int(sw * 0.365)
-        rect_height = int(sh * 0.14)
-        rect_x = sw - rect_width
-        rect_y = 0
-        
         # White rectangle (Top Right - Masjid Info)
-        pygame.draw.rect(self.window, WHITE, (rect_x, rect_y, rect_width, rect_height))
-        
+        pygame.draw.rect(background, WHITE, layout.info_rect)
+
         # Secondary color rectangle (Bottom Right - Countdown/Sunrise)
-        second_rect_y = rect_y + rect_height
-        second_rect_height = sh - second_rect_y
-        pygame.draw.rect(self.window, self.SECONDARY, (rect_x, second_rect_y, rect_width, second_rect_height))
+        pygame.draw.rect(background, self.SECONDARY, layout.countdown_panel_rect)
 
         # Black rectangle (Top Left - Clock/Date)
-        third_rect_width = sw - rect_width
-        third_rect_height = int(sh * 0.14)
-        third_rect_x = 0
-        third_rect_y = 0
-        pygame.draw.rect(self.window, BLACK, (third_rect_x, third_rect_y, third_rect_width, third_rect_height))
-
-        # Logical border position for date/time elements
-        self.border_x = rect_x - int(sw * 0.005)
+        pygame.draw.rect(background, BLACK, layout.clock_panel_rect)
 
         # Render Masjid name and address (Top Right)
-        title_text = self.fonts["text"].render("Masjid Nurul Islam", True, BLACK)
-        title_text_rect = title_text.get_rect(center=(int(sw * 0.82), int(sh * 0.05)))
-        subtext = self.fonts["sub_text"].render("615 Rutger St, Utica, NY 13501", True, BLACK)
-        subtext_rect = subtext.get_rect(center=(int(sw * 0.82), int(sh * 0.10)))
-        self.window.blit(title_text, title_text_rect)
-        self.window.blit(subtext, subtext_rect)
-
-    def _draw_date_and_time(self, current_time: datetime):
+        title_text = self._render("text", "Masjid Nurul Islam", BLACK)
+        title_text_rect = title_text.get_rect(center=layout.title_center)
+        subtext = self._render("sub_text", "615 Rutger St, Utica, NY 13501", BLACK)
+        subtext_rect = subtext.get_rect(center=layout.subtitle_center)
+        background.blit(title_text, title_text_rect)
+        background.blit(subtext, subtext_rect)
+
+        self._background_surface = background.convert()
+
+    def _build_static_layers(self):
+        """Pre-composes the Sunrise labels ('Sunrise' and 'شروق') into a single surface."""
+        layout = self.layout
+        text_surface = self._render("sunrise_text", "Sunrise", self.PRIMARY)
+        arabic_surface = self._render("sunrise_arabic", ARABIC_PRAYER_DISPLAY.get("Sunrise", ""), self.PRIMARY)
+
+        # Positions relative to the countdown unit text's centerx and bottom
+        text_rect = text_surface.get_rect(center=(layout.sunrise_text_dx, layout.sunrise_dy))
+        arabic_rect = arabic_surface.get_rect(center=(layout.sunrise_arabic_dx, layout.sunrise_arabic_dy))
+        bounds = text_rect.union(arabic_rect)
+
+        labels = pygame.Surface(bounds.size, pygame.SRCALPHA)
+        labels.blit(text_surface, text_rect.move(-bounds.x, -bounds.y))
+        labels.blit(arabic_surface, arabic_rect.move(-bounds.x, -bounds.y))
+        self._sunrise_labels = (labels.convert_alpha(), bounds.topleft)
+
+    def _draw_background_and_masthead(self) -> pygame.Rect:
+        """Draws the main background and the header sections."""
+        self._frame_blits.append((self._background_surface, (0, 0)))
+        return self.window.get_rect()
+
+    def _draw_date_and_time(self, current_time: datetime) -> pygame.Rect:
         """Draws the current time and Gregorian/Hijri dates in the top-left area."""
-        sw, sh = self.screen_width, self.screen_height
+        layout = self.layout
+
+        # Restore the panel background (Top Left - Clock/Date)
+        self._frame_blits.append((self._background_surface, layout.clock_panel_rect, layout.clock_panel_rect))
 
-        # Current Time
-        current_time_str = current_time.strftime('%I:%M:%S %p')
-        current_time_surface = self.fonts["current_time"].render(current_time_str, True, WHITE)
-        current_time_rect = current_time_surface.get_rect(topleft=(int(sw * 0.02), int(sh * 0.01)))
-        self.window.blit(current_time_surface, current_time_rect)
+        # Current Time (changes every second, so composed from pre-rendered glyphs)
+        clock_atlas = self._glyph_atlases["current_time"]
+        clock_blits, clock_width = clock_atlas.layout(format_clock_time(current_time), layout.clock_topleft)
+        self._frame_blits.extend(clock_blits)
+        current_time_rect = pygame.Rect(layout.clock_topleft, (clock_width, clock_atlas.height))
 
         # Gregorian Date
-        current_date_str = current_time.strftime('%d %B %Y')
-        center_x = sw // 2 + int(sw * 0.108)
-        date_surface = self.fonts["date"].render(current_date_str, True, WHITE)
-        date_rect = date_surface.get_rect(midleft=(center_x - int(sw * 0.204), current_time_rect.centery + int(sh * 0.02)))
+        current_date_str = format_gregorian_date(current_time)
+        date_surface = self._render("date", current_date_str, WHITE)
+        date_rect = date_surface.get_rect(midleft=(layout.date_x, current_time_rect.centery + layout.date_dy))
         
         # Check if Gregorian date fits
-        max_date_width = self.border_x - date_rect.left - int(sw * 0.01)
+        max_date_width = layout.border_x - date_rect.left - layout.date_margin
         if date_rect.width <= max_date_width:
-            self.window.blit(date_surface, date_rect)
+            self._frame_blits.append((date_surface, date_rect))
 
         # Islamic Date
-        h_day, h_month, h_year = self._get_islamic_date(current_time)
-        islamic_date_str = f"{str(h_day).zfill(2)} {h_month} {h_year}"
-        islamic_date_surface = self.fonts["islamic_date"].render(islamic_date_str, True, GRAY)
-        islamic_date_rect = islamic_date_surface.get_rect(midleft=(date_rect.left, date_rect.top - int(sh * 0.025)))
+        _, _, _, islamic_date_str = self._get_islamic_date(current_time)
+        islamic_date_surface = self._render("islamic_date", islamic_date_str, GRAY)
+        islamic_date_rect = islamic_date_surface.get_rect(midleft=(date_rect.left, date_rect.top - layout.islamic_date_dy))
 
         # Check if Islamic date fits
-        max_islamic_date_width = self.border_x - islamic_date_rect.left - int(sw * 0.01)
+        max_islamic_date_width = layout.border_x - islamic_date_rect.left - layout.date_margin
         if islamic_date_rect.width <= max_islamic_date_width:
-            self.window.blit(islamic_date_surface, islamic_date_rect)
+            self._frame_blits.append((islamic_date_surface, islamic_date_rect))
+
+        return layout.clock_panel_rect
+
+    def _get_prayer_row(self, prayer: str, time: str, iqamah_time: str) -> Tuple[pygame.Surface, Tuple[int, int]]:
+        """Returns the composed surface for one prayer row and its position (x, offset from the row's top)."""
+        key = (prayer, time, iqamah_time, self.SECONDARY)
+        cached = self._row_cache.get(key)
+        if cached is not None:
+            return cached
+
+        layout = self.layout
+        parts = []
+
+        # 1. English Prayer Name
+        prayer_name_surface = self.fonts["prayer_times"].render(prayer.strip(), True, self.SECONDARY)
+        parts.append((prayer_name_surface, prayer_name_surface.get_rect(topleft=(layout.name_x, 0))))
+
+        # 2. Adhan Time
+        time_surface = self._rasterize("prayer_times_adhan", time, WHITE)
+        parts.append((time_surface, time_surface.get_rect(center=(layout.adhan_x, layout.time_dy))))
+
+        # 3. Iqamah Time
+        if iqamah_time:
+            iqamah_surface = self._rasterize("prayer_times_jamat", iqamah_time, WHITE)
+            parts.append((iqamah_surface, iqamah_surface.get_rect(center=(layout.iqamah_x, layout.time_dy))))
+
+        # 4. Arabic Prayer Name, just to the right of the English name
+        bidi_text = ARABIC_PRAYER_DISPLAY.get(prayer.strip(), "")
+        arabic_surface = self.fonts["prayer_times_arabic"].render(bidi_text, True, WHITE)
+        parts.append((arabic_surface, arabic_surface.get_rect(
+            topleft=(layout.name_x + prayer_name_surface.get_width() + layout.arabic_gap, -layout.arabic_dy)
+        )))
+
+        # Compose the parts onto a transparent surface covering all of them
+        bounds = parts[0][1].unionall([rect for _, rect in parts[1:]])
+        row_surface = pygame.Surface(bounds.size, pygame.SRCALPHA)
+        for surface, rect in parts:
+            row_surface.blit(surface, rect.move(-bounds.x, -bounds.y))
+
+        cached = (row_surface.convert_alpha(), bounds.topleft)
+        self._row_cache[key] = cached
+        return cached
 
     def _draw_prayer_times(self):
         """Draws the table of prayer names, Adhan times, and Iqamah times."""
+        layout = self.layout
         if not self.today_prayers:
             return
 
-        sw, sh = self.screen_width, self.screen_height
-        center_x = sw // 2 + int(sw * 0.108)
-        adhan_center_x = center_x - int(sw * 0.03)
-
         # Column Labels
-        y_label = int(sh * 0.25) - int(sh * 0.05)
-        adhan_label = self.fonts["prayer_times"].render("Adhan", True, self.SECONDARY)
-        iqamah_label = self.fonts["prayer_times"].render("Iqamah", True, self.SECONDARY)
-        
-        self.window.blit(adhan_label, adhan_label.get_rect(center=(adhan_center_x - int(sw * 0.21), y_label)))
-        self.window.blit(iqamah_label, iqamah_label.get_rect(center=(center_x - int(sw * 0.065), y_label)))
-
-        y_offset = int(sh * 0.25)
+        self._frame_blits.append(self._render_at("prayer_times", "Adhan", self.SECONDARY, (layout.adhan_x, layout.label_y)))
+        self._frame_blits.append(self._render_at("prayer_times", "Iqamah", self.SECONDARY, (layout.iqamah_x, layout.label_y)))
+
+        y_offset = layout.rows_top
+        row_step = layout.row_step_wide if self.hide_eid_message else layout.row_step_compact
+        today_prayers = self.today_prayers
+        get_row = self._get_prayer_row
+        queue_blit = self._frame_blits.append
         
         # Determine prayers to display
         prayer_list = ["Fajr", "Dhuhr", "Asr", "Maghrib", "Isha", "Jummah"]
         
         self.eid_message_y = 0
-        prayer_name_width = 0
 
         for prayer in prayer_list:
-            time = self.today_prayers.get(prayer, "")
-            iqamah_time = self.today_prayers.get(f"{prayer}_Iqamah", "")
+            time = today_prayers.get(prayer, "")
+            iqamah_time = today_prayers.get(f"{prayer}_Iqamah", "")
 
             if time:
-                # 1. English Prayer Name
-                prayer_name_surface = self.fonts["prayer_times"].render(prayer.strip(), True, self.SECONDARY)
-                prayer_name_width = max(prayer_name_width, prayer_name_surface.get_width())
-                prayer_name_x = int(sw * 0.02)
-                self.window.blit(prayer_name_surface, (prayer_name_x, y_offset))
-
-                # 2. Adhan Time
-                time_surface = self.fonts["prayer_times_adhan"].render(time, True, WHITE)
-                time_rect = time_surface.get_rect(center=(adhan_center_x - int(sw * 0.21), y_offset + int(sh * 0.035)))
-                self.window.blit(time_surface, time_rect)
-
-                # 3. Iqamah Time
-                if iqamah_time:
-                    iqamah_surface = self.fonts["prayer_times_jamat"].render(iqamah_time, True, WHITE)
-                    iqamah_rect = iqamah_surface.get_rect(center=(center_x - int(sw * 0.065), y_offset + int(sh * 0.035)))
-                    self.window.blit(iqamah_surface, iqamah_rect)
-
-                # 4. Arabic Prayer Name
-                arabic_prayer = ARABIC_PRAYER_NAMES.get(prayer.strip(), "")
-                reshaped_text = arabic_reshaper.reshape(arabic_prayer)
-                bidi_text = get_display(reshaped_text)
-                arabic_surface = self.fonts["prayer_times_arabic"].render(bidi_text, True, WHITE)
-                
-                # Position Arabic text just to the right of the English name
-                arabic_rect = arabic_surface.get_rect(
-                    topleft=(prayer_name_x + prayer_name_surface.get_width() + int(sw * 0.01), y_offset - int(sh * 0.015))
-                )
-                self.window.blit(arabic_surface, arabic_rect)
+                # Name, times and Arabic name are pre-composed into a single row surface
+                row_surface, (row_x, row_dy) = get_row(prayer, time, iqamah_time)
+                queue_blit((row_surface, (row_x, y_offset + row_dy)))
 
                 # Move to the next row
-                if self.hide_eid_message:
-                    y_offset += int(sh * 0.125)
-                else:
-                    y_offset += int(sh * 0.10)
+                y_offset += row_step
         
         self.eid_message_y = y_offset
 
     def _draw_eid_announcement(self):
         """Draws the configurable Eid announcement message."""
+        layout = self.layout
         if self.hide_eid_message:
             return
-
-        sw, sh = self.screen_width, self.screen_height
         
         # Static Eid message (as in original code)
         eid_message = "Eid Salah will be held on June 6, 2025 at 08:30 AM"
         
-        eid_message_surface = self.fonts["eid_announcement"].render(eid_message, True, self.SECONDARY)
-        
-        # Calculate center position to align with the prayer time columns
-        center_x = sw // 2 + int(sw * 0.108)
-        adhan_center_x = center_x - int(sw * 0.03)
-
-        name_x = int(sw * 0.02) 
-        adhan_x = adhan_center_x - int(sw * 0.21)
-        iqamah_x = center_x - int(sw * 0.065)
-        
-        # Average of the three main column positions
-        target_center_x = (name_x + adhan_x + iqamah_x) // 3
+        eid_message_surface = self._render("eid_announcement", eid_message, self.SECONDARY)
         
+        # Centered under the prayer time columns
         eid_message_rect = eid_message_surface.get_rect(
-            center=(target_center_x, self.eid_message_y + int(sh * 0.05))
+            center=(layout.eid_center_x, self.eid_message_y + layout.eid_dy)
         )
-        
-        # Manual adjustment from original code
-        eid_message_rect.centerx -= int(sw * 0.013) 
 
-        self.window.blit(eid_message_surface, eid_message_rect)
+        self._frame_blits.append((eid_message_surface, eid_message_rect))
 
         # Draw the (empty) additional line for the second part of the message
         additional_eid_message = "" # Empty in original code
-        additional_eid_message_surface = self.fonts["eid_announcement"].render(additional_eid_message, True, WHITE)
+        additional_eid_message_surface = self._render("eid_announcement", additional_eid_message, WHITE)
         additional_eid_message_rect = additional_eid_message_surface.get_rect(
-            center=(eid_message_rect.centerx, eid_message_rect.bottom + int(sh * 0.02))
+            center=(eid_message_rect.centerx, eid_message_rect.bottom + layout.eid_line_dy)
         )
-        self.window.blit(additional_eid_message_surface, additional_eid_message_rect)
-
-    def _draw_countdown(self):
-        """Draws the countdown to the next prayer event and the Sunrise time."""
-        sw, sh = self.screen_width, self.screen_height
-        next_event, hours, minutes, seconds, is_iqamah = self._get_time_until_next_event()
+        self._frame_blits.append((additional_eid_message_surface, additional_eid_message_rect))
+
+    def _draw_countdown(self, current_time: datetime, force: bool = False) -> Optional[pygame.Rect]:
+        """Draws the countdown to the next prayer event and the Sunrise time.
+
+        Returns None without drawing when the panel would look the same as last time, unless forced.
+        """
+        layout = self.layout
+        next_event, hours, minutes, seconds, is_iqamah = self._get_time_until_next_event(current_time)
+
+        # Countdown Value and Unit (only the largest non-zero unit is shown)
+        if hours > 0:
+            value_text = f"{hours}"
+            unit_text = "hour" if hours == 1 else "hours"
+        elif minutes > 0:
+            value_text = f"{minutes}"
+            unit_text = "minute" if minutes == 1 else "minutes"
+        else:
+            value_text = f"{seconds}"
+            unit_text = "second" if seconds == 1 else "seconds"
+
+        # Outside the last minute the panel only changes once a minute
+        countdown_state = (next_event, is_iqamah, value_text, unit_text)
+        if not force and countdown_state == self._last_countdown_key:
+            return None
+        self._last_countdown_key = countdown_state
+
+        # Restore the panel background (Bottom Right - Countdown/Sunrise)
+        self._frame_blits.append((self._background_surface, layout.countdown_panel_rect, layout.countdown_panel_rect))
         
         # Countdown Timer (Right Side)
         if next_event:
             # 1. Countdown Text
             event_name = 'Iqamah' if is_iqamah else next_event
             countdown_text = f"Time until {event_name}"
-            countdown_text_surface = self.fonts["countdown_text"].render(countdown_text, True, self.PRIMARY)
-            countdown_text_rect = countdown_text_surface.get_rect(center=(int(sw * 0.82), int(sh * 0.30)))
-            self.window.blit(countdown_text_surface, countdown_text_rect)
-
-            # 2. Countdown Value and Unit
-            if hours > 0:
-                value_text = f"{hours}"
-                unit_text = "hour" if hours == 1 else "hours"
-            elif minutes > 0:
-                value_text = f"{minutes}"
-                unit_text = "minute" if minutes == 1 else "minutes"
-            else:
-                value_text = f"{seconds}"
-                unit_text = "second" if seconds == 1 else "seconds"
-                
-            countdown_value_surface = self.fonts["countdown_value"].render(value_text, True, WHITE)
-            countdown_unit_surface = self.fonts["countdown_unit"].render(unit_text, True, self.PRIMARY)
+            self._frame_blits.append(self._render_at(
+                "countdown_text", countdown_text, self.PRIMARY, (layout.countdown_x, layout.countdown_text_y)
+            ))
+
+            # 2. The value font is huge, so keep the rendered pair and positions per displayed value
+            countdown_key = (value_text, unit_text, self.PRIMARY, WHITE)
+            cached = self._countdown_cache.get(countdown_key)
+            if cached is None:
+                countdown_value_surface = self.fonts["countdown_value"].render(value_text, True, WHITE).convert_alpha()
+                countdown_unit_surface = self.fonts["countdown_unit"].render(unit_text, True, self.PRIMARY).convert_alpha()
+
+                countdown_value_rect = countdown_value_surface.get_rect(center=(layout.countdown_x, layout.countdown_value_y))
+
+                # Position the unit text below the value
+                countdown_unit_rect = countdown_unit_surface.get_rect(
+                    midtop=(countdown_value_rect.centerx, countdown_value_rect.bottom + layout.countdown_unit_dy)
+                )
 
-            countdown_value_rect = countdown_value_surface.get_rect(center=(int(sw * 0.82), int(sh * 0.50)))
-            
-            # Position the unit text below the value
-            countdown_unit_rect = countdown_unit_surface.get_rect(
-                midtop=(countdown_value_rect.centerx, countdown_value_rect.bottom + int(sh * 0.00050))
-            )
+                cached = (countdown_value_surface, countdown_value_rect, countdown_unit_surface, countdown_unit_rect)
+                if len(self._countdown_cache) >= COUNTDOWN_CACHE_SIZE:
+                    del self._countdown_cache[next(iter(self._countdown_cache))] # Drop the oldest entry
+                self._countdown_cache[countdown_key] = cached
+            countdown_value_surface, countdown_value_rect, countdown_unit_surface, countdown_unit_rect = cached
 
-            self.window.blit(countdown_value_surface, countdown_value_rect)
-            self.window.blit(countdown_unit_surface, countdown_unit_rect)
+            self._frame_blits.append((countdown_value_surface, countdown_value_rect))
+            self._frame_blits.append((countdown_unit_surface, countdown_unit_rect))
             
             # 3. Sunrise Time Display (Below Countdown)
             self._draw_sunrise(countdown_unit_rect)
 
+        return layout.countdown_panel_rect
+
     def _draw_sunrise(self, reference_rect: pygame.Rect):
         """Draws the Sunrise time display."""
         if not self.today_prayers:
             return
 
-        sw, sh = self.screen_width, self.screen_height
+        layout = self.layout
         sunrise_time = self.today_prayers.get("Sunrise", "")
         
         if sunrise_time:
-            # Text 'Sunrise' (English)
-            sunrise_text_surface = self.fonts["sunrise_text"].render("Sunrise", True, self.PRIMARY)
-            sunrise_text_x = reference_rect.centerx - int(sw * 0.05)
-            y_pos = reference_rect.bottom + int(sh * 0.09)
-            sunrise_text_rect = sunrise_text_surface.get_rect(center=(sunrise_text_x, y_pos))
-            self.window.blit(sunrise_text_surface, sunrise_text_rect)
-
-            # Text 'شروق' (Arabic)
-            arabic_sunrise = ARABIC_PRAYER_NAMES.get("Sunrise", "")
-            reshaped_text = arabic_reshaper.reshape(arabic_sunrise)
-            bidi_text = get_display(reshaped_text)
-            arabic_surface = self.fonts["sunrise_arabic"].render(bidi_text, True, self.PRIMARY)
-            arabic_x = reference_rect.centerx + int(sw * 0.057)
-            arabic_rect = arabic_surface.get_rect(center=(arabic_x, y_pos - int(sh * 0.003)))
-            self.window.blit(arabic_surface, arabic_rect)
+            queue_blit = self._frame_blits.append
+            centerx, bottom = reference_rect.centerx, reference_rect.bottom
+
+            # Labels 'Sunrise' and 'شروق' (pre-composed)
+            labels_surface, (dx, dy) = self._sunrise_labels
+            queue_blit((labels_surface, (centerx + dx, bottom + dy)))
 
             # Sunrise Time
-            sunrise_time_surface = self.fonts["prayer_times_jamat"].render(sunrise_time, True, WHITE)
-            sunrise_time_x = reference_rect.centerx - int(sw * 0.005)
-            sunrise_time_y = reference_rect.bottom + int(sh * 0.164)
-            sunrise_time_rect = sunrise_time_surface.get_rect(center=(sunrise_time_x, sunrise_time_y))
-            self.window.blit(sunrise_time_surface, sunrise_time_rect)
+            queue_blit(self._render_at(
+                "prayer_times_jamat", sunrise_time, WHITE, (centerx + layout.sunrise_time_dx, bottom + layout.sunrise_time_dy)
+            ))
 
     # --- Main Loop and Execution ---
 
+    def _get_frame_state(self) -> tuple:
+        """Returns everything besides the clock that affects the display; a change forces a full redraw."""
+        return (
+            self.current_date,
+            self.current_theme_index,
+            self.hide_eid_message,
+            self.today_prayers,
+            self.settings.get("date_font_size"),
+            self.settings.get("islamic_date_font_size"),
+            self.settings.get("eid_announcement_font_size"),
+        )
+
+    def _flush_blits(self):
+        """Draws the blits queued this frame in one batch, grouped by source surface."""
+        # The background comes first and no two text surfaces overlap, so a stable sort by each
+        # source's first appearance keeps the result identical while making same-source blits
+        # (background restores, clock glyphs from the atlas) contiguous
+        first_seen: Dict[int, int] = {}
+        for entry in self._frame_blits:
+            first_seen.setdefault(id(entry[0]), len(first_seen))
+        self._frame_blits.sort(key=lambda entry: first_seen[id(entry[0])])
+
+        self.window.blits(self._frame_blits, doreturn=False)
+        self._frame_blits.clear()
+
+    def _draw_frame(self, current_time: datetime, full_redraw: bool):
+        """Draws one frame and pushes the changed areas to the display."""
+        # Background, masthead and prayer table only change on a full redraw
+        if full_redraw:
+            self._dirty.append(self._draw_background_and_masthead()) # The whole window, covering the rest
+            self._draw_prayer_times()
+            self._draw_eid_announcement()
+            self._draw_date_and_time(current_time)
+            self._draw_countdown(current_time, force=True)
+        else:
+            # Partial frames touch at most the clock and countdown panels
+            self._dirty.append(self._draw_date_and_time(current_time))
+            countdown_rect = self._draw_countdown(current_time)
+            if countdown_rect:
+                self._dirty.append(countdown_rect)
+
+        # Display Update (one batched blit, then only the areas drawn this frame)
+        self._flush_blits()
+        pygame.display.update(self._dirty)
+        self._dirty.clear()
+
     def run(self):
         """The main application loop."""
-        clock = pygame.time.Clock()
-        
-        while True:
-            # 1. Event Handling
-            self._handle_input()
+        timeout_ms = 0 # Draw the first frame straight away
+        while self._running:
+            # 1. Event Handling (also the wait for the next second)
+            self._handle_input(timeout_ms)
+            if not self._running:
+                break
             
-            # 2. State Updates
+            # 2. State Updates (one clock reading shared by everything drawn this frame)
             current_time = datetime.now()
             
             # Check for date change and reload data if necessary
-            new_date = date.today()
+            new_date = current_time.date() # Same clock reading as the rest of the frame
             if new_date != self.current_date:
                 self.current_date = new_date
-                self.today_prayers = get_today_prayer_times(self.prayer_times)
+                self.today_prayers = get_today_prayer_times(self.prayer_times, new_date)
+                self._clear_render_caches() # Keep long-running caches bounded to a day's strings
+            self._refresh_day_state(current_time)
 
             # Check and play Adhan/Iqamah sound
             if self.today_prayers:
                 self._check_and_play_adhan(current_time)
             
-            # 3. Drawing
-            self._draw_background_and_masthead()
-            self._draw_date_and_time(current_time)
-            self._draw_prayer_times()
-            self._draw_eid_announcement()
-            self._draw_countdown()
+            # 3. Drawing (skipped until the clock ticks or the displayed state changes)
+            current_time_str = format_clock_time(current_time)
+            frame_state = self._get_frame_state()
+            full_redraw = frame_state != self._last_frame_state
+            redraw = full_redraw or current_time_str != self._last_time_str
+            if redraw:
+                self._last_time_str = current_time_str
+                self._last_frame_state = frame_state
+                self._draw_frame(current_time, full_redraw)
+
+            # Nothing on screen changes faster than the clock's seconds
+            timeout_ms = 1000 - datetime.now().microsecond // 1000 + TICK_MARGIN_MS
 
-            # 4. Display Update
-            pygame.display.flip()
-            clock.tick(15) # Limit to 15 FPS
+        self.quit()
 
     def quit(self):
         """Saves settings and gracefully exits Pygame."""
-        
-        save_settings({
-            "current_theme_index": self.current_theme_index,
-            "date_font_size": self.settings["date_font_size"],
-            "islamic_date_font_size": self.settings["islamic_date_font_size"],
-            "eid_announcement_font_size": self.settings["eid_announcement_font_size"],
-        })
-        
+        self.settings["current_theme_index"] = self.current_theme_index # Font sizes are kept in sync as they change
         save_settings(self.settings)
+
+        # Free cached surfaces while SDL is still up, rather than at interpreter teardown
+        self._clear_render_caches()
+        self._glyph_atlases.clear()
+        self._sunrise_labels = None
+        self._background_surface = None
+        gc.collect()
+
         pygame.quit()
         sys.exit()
 
 if __name__ == "__main__":
     app = MasjidDisplay()
-    try:
-        app.run()
-    except Exception as e:
-        print(f"An unexpected error occurred: {e}")
-        app.quit()
\ No newline at end of file
+    app.run()
\ No newline at end of file